@@ -1,4 +1,4 @@
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 import torch
 import time
@@ -11,17 +11,27 @@ from torch.testing._internal.dist_utils import (
     dist_init,
     initialize_pg,
     worker_name,
-    get_function_event
 )
 from torch.testing._internal.distributed.rpc.rpc_agent_test_fixture import (
     RpcAgentTestFixture,
 )
 
+# Tensor literals shared by the tests below, so that each test does not
+# rebuild them on every call. None of the callees mutate their inputs.
+_T11 = torch.tensor([1, 1])
+_T22 = torch.tensor([2, 2])
+_T33 = torch.tensor([3, 3])
+_T44 = torch.tensor([4, 4])
+_ONES22 = torch.ones(2, 2)
+_ZEROS22 = torch.zeros(2, 2)
+# What torch.add(_ONES22, 1) evaluates to on the callee.
+_ONES22_PLUS_1 = _ONES22 + 1
+
 def sleep(t):
     time.sleep(t)
 
 def rpc_return_rref(dst):
-    return rpc.remote(dst, torch.add, args=(torch.ones(2, 2), 1))
+    return rpc.remote(dst, torch.add, args=(_ONES22, 1))
 
 @torch.jit.script
 def rref_local_value(rref):
@@ -29,6 +39,12 @@ def rref_local_value(rref):
     return rref.local_value()
 
 
+@torch.jit.script
+def rref_tensor_is_owner(rref_var):
+    # type: (RRef[Tensor]) -> bool
+    return rref_var.is_owner()
+
+
 def return_value(value):
     # type: (int) -> int
     return value
@@ -36,14 +52,9 @@ def return_value(value):
 class RRefAPITest:
     @dist_init
     def test_rref_is_owner(self):
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
+        dst_worker_name = self._next_worker
         rref_var = rpc_return_rref(dst_worker_name)
 
-        @torch.jit.script
-        def rref_tensor_is_owner(rref_var):
-            # type: (RRef[Tensor]) -> bool
-            return rref_var.is_owner()
-
         res = rref_tensor_is_owner(rref_var)
         self.assertEqual(res, False)
 
@@ -52,14 +63,14 @@ class RRefAPITest:
         if self.rank != 0:
             return
 
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
+        dst_worker_name = self._next_worker
         rref = rpc_return_rref(dst_worker_name)
 
         with self.assertRaisesRegex(RuntimeError, r"Can't call RRef.local_value\(\) on a non-owner RRef"):
             rref_local_value(rref)
 
-        ret = ret = rpc.rpc_sync(dst_worker_name, rref_local_value, (rref,))
-        self.assertEqual(ret, torch.add(torch.ones(2, 2), 1))
+        ret = rpc.rpc_async(dst_worker_name, rref_local_value, (rref,)).wait()
+        self.assertEqual(ret, _ONES22_PLUS_1)
 
     @dist_init
     def test_local_rref_local_value(self):
@@ -125,6 +136,12 @@ def call_fork_with_profiling(handle: Tensor) -> Tensor:
     return ret
 
 
+@torch.jit.script
+def rref_to_here(rref_var):
+    # type: (RRef[Tensor]) -> Tensor
+    return rref_var.to_here()
+
+
 class MyScriptModuleWithRRefs(torch.jit.ScriptModule):
     def __init__(self, dst_worker):
         super().__init__()
@@ -135,11 +152,18 @@ class MyScriptModuleWithRRefs(torch.jit.ScriptModule):
     @torch.jit.script_method
     def forward(self):
         # type: () -> Tensor
-        res_tensor = torch.ones(2, 2)
+        # Fork the to_here() calls so that the fetches overlap instead of
+        # blocking on each RRef in turn.
+        futs = torch.jit.annotate(List[torch.jit.Future[Tensor]], [])
         for rref in self.rrefs:
-            res_tensor += rref.to_here()
+            futs.append(torch.jit._fork(rref_to_here, rref))
+
+        values = torch.jit.annotate(List[Tensor], [])
+        for fut in futs:
+            values.append(torch.jit._wait(fut))
 
-        return res_tensor
+        # One reduction instead of an in-place add per RRef.
+        return torch.ones(2, 2) + torch.stack(values).sum(0)
 
 
 @torch.jit.script
@@ -191,6 +215,41 @@ def script_run_forward_rref_my_script_module(rref):
     return rref.to_here().forward()
 
 
+def use_rref_on_owner_my_script_class(rref):
+    # type: (RRef[MyScriptClass]) -> int
+    args = (rref,)
+    kwargs: Dict[str, Any] = {}  # noqa
+    fut = rpc.rpc_async(
+        rref.owner(), script_run_get_value_rref_my_script_class, args, kwargs
+    )
+    ret = fut.wait()
+    return ret
+
+
+def use_rref_on_owner_my_script_module(rref):
+    # type: (RRef[MyModuleInterface]) -> Tensor
+    args = (rref,)
+    kwargs: Dict[str, Any] = {}
+    fut = rpc.rpc_async(
+        rref.owner_name(),
+        script_run_forward_rref_my_script_module,
+        args,
+        kwargs,
+    )
+    ret = fut.wait()
+    return ret
+
+
+# Scripted once here so that the tests below can run each helper both as
+# plain Python and as TorchScript.
+script_use_rref_on_owner_my_script_class = torch.jit.script(
+    use_rref_on_owner_my_script_class
+)
+script_use_rref_on_owner_my_script_module = torch.jit.script(
+    use_rref_on_owner_my_script_module
+)
+
+
 class LocalRRefTest:
     @dist_init
     def test_create_local_script_class_rref_in_py(self):
@@ -227,30 +286,19 @@ class LocalRRefTest:
         if self.rank != 0:
             return
 
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
+        dst_worker_name = self._next_worker
 
         # Create a local RRef<MyScripClass> remotely in Python.
         rref = rpc.rpc_sync(
             dst_worker_name, owner_create_rref_my_script_class, args=(self.rank,)
         )
 
-        def use_rref_on_owner(rref):
-            # type: (RRef[MyScriptClass]) -> int
-            args = (rref,)
-            kwargs: Dict[str, Any] = {}  # noqa
-            fut = rpc.rpc_async(
-                rref.owner(), script_run_get_value_rref_my_script_class, args, kwargs
-            )
-            ret = fut.wait()
-            return ret
-
         # Use RRef<MyScripClass> in local Python RPC and remote Script run.
-        ret = use_rref_on_owner(rref)
+        ret = use_rref_on_owner_my_script_class(rref)
         self.assertEqual(ret, self.rank)
 
         # Use RRef<MyScriptClass> in local Script RPC and remote Script run.
-        use_rref_on_owner_script = torch.jit.script(use_rref_on_owner)
-        ret = use_rref_on_owner_script(rref)
+        ret = script_use_rref_on_owner_my_script_class(rref)
         self.assertEqual(ret, self.rank)
 
     @dist_init
@@ -258,33 +306,19 @@ class LocalRRefTest:
         if self.rank != 0:
             return
 
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
+        dst_worker_name = self._next_worker
 
         # Create a local RRef<MyModuleInterface> remotely in Python.
         rref = rpc.rpc_sync(
             dst_worker_name, owner_create_rref_my_script_module, args=(self.rank,)
         )
 
-        def use_rref_on_owner(rref):
-            # type: (RRef[MyModuleInterface]) -> Tensor
-            args = (rref,)
-            kwargs: Dict[str, Any] = {}
-            fut = rpc.rpc_async(
-                rref.owner_name(),
-                script_run_forward_rref_my_script_module,
-                args,
-                kwargs,
-            )
-            ret = fut.wait()
-            return ret
-
         # Use RRef<MyScripClass> in local Python RPC and remote Script run.
-        ret = use_rref_on_owner(rref)
+        ret = use_rref_on_owner_my_script_module(rref)
         self.assertEqual(ret, torch.ones(self.rank))
 
         # Use RRef<MyScriptClass> in local Script RPC and remote Script run.
-        use_rref_on_owner_script = torch.jit.script(use_rref_on_owner)
-        ret = use_rref_on_owner_script(rref)
+        ret = script_use_rref_on_owner_my_script_module(rref)
         self.assertEqual(ret, torch.ones(self.rank))
 
 
@@ -296,8 +330,8 @@ def python_function():
 def two_args_two_kwargs(
     first_arg,
     second_arg,
-    first_kwarg=torch.tensor([3, 3]),
-    second_kwarg=torch.tensor([4, 4]),
+    first_kwarg=_T33,
+    second_kwarg=_T44,
 ):
     return first_arg + second_arg + first_kwarg + second_kwarg
 
@@ -321,81 +355,135 @@ def raise_script():
 
 @torch.jit.script
 def rpc_async_call_remote_torchscript_in_torchscript(
-    dst_worker_name: str, args: Tuple[Tensor, Tensor], kwargs: Dict[str, Tensor]
+    dst_worker_name: str,
+    args: Tuple[Tensor, Tensor],
+    kwargs_list: List[Dict[str, Tensor]],
+):
+    # Send one call per kwargs dict before waiting on any of them, so the
+    # round trips overlap.
+    futs = torch.jit.annotate(List[torch.jit.Future[Tensor]], [])
+    for kwargs in kwargs_list:
+        futs.append(rpc.rpc_async(dst_worker_name, two_args_two_kwargs, args, kwargs))
+
+    rets = torch.jit.annotate(List[Tensor], [])
+    for fut in futs:
+        rets.append(fut.wait())
+    return rets
+
+
+@torch.jit.script
+def rpc_async_call_remote_torchscript_in_torchscript_with_extra_arg(
+    dst_worker_name: str,  # noqa: E999
 ):
+    args = (
+        torch.tensor([1, 1]),
+        torch.tensor([2, 2]),
+        # This extra arg will be fed to the first kwarg.
+        torch.tensor([2, 2]),
+    )
+    kwargs = {"second_kwarg": torch.tensor([3, 3])}
     fut = rpc.rpc_async(dst_worker_name, two_args_two_kwargs, args, kwargs)
     ret = fut.wait()
     return ret
 
 
-class JitRpcAsyncOpTest:
-    # Call functions remotely from Script.
-    @dist_init
-    def test_all_kwargs_are_populated_by_defaults(self):
-        if self.rank != 0:
-            return
+@torch.jit.script
+def rpc_async_call_remote_torchscript_in_torchscript_with_assorted_types(
+    dst_worker_name: str
+):
+    args = (torch.tensor([1, 1]), "str_arg", 1)
+    # Must annotate the value type as `Any`, because JIT type inference
+    # does not support multiple types when defining a Dict.
+    # The error JIT gives is,
+    # "Dict values must contain only a single type, "
+    # "expected: Tensor but found str instead."
+    kwargs: Dict[str, Any] = {
+        "tensor_kwarg": torch.tensor([3, 3]),
+        "str_kwarg": "_str_kwarg",
+        "int_kwarg": 3,
+    }
+    fut = rpc.rpc_async(
+        dst_worker_name, assorted_types_args_kwargs, args, kwargs
+    )
+    ret = fut.wait()
+    return ret
 
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
 
-        args = (torch.tensor([1, 1]), torch.tensor([2, 2]))
-        kwargs = {}
-        ret = rpc_async_call_remote_torchscript_in_torchscript(
-            dst_worker_name, args, kwargs
-        )
-        self.assertEqual(ret, torch.tensor([10, 10]))
+@torch.jit.script
+def rpc_async_call_remote_torchscript_in_torchscript_without_kwargs_passed(
+    dst_worker_name: str
+):
+    args = ()
+    fut = rpc.rpc_async(dst_worker_name, no_arg, args)
+    ret = fut.wait()
+    return ret
 
-    @dist_init
-    def test_some_kwargs_are_populated_by_defaults(self):
-        if self.rank != 0:
-            return
 
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
+@torch.jit.script
+def rpc_async_call_remote_torchscript_in_torchscript_without_args_kwargs_passed(
+    dst_worker_name: str
+):
+    fut = rpc.rpc_async(dst_worker_name, no_arg)
+    ret = fut.wait()
+    return ret
 
-        args = (torch.tensor([1, 1]), torch.tensor([2, 2]))
-        kwargs = {"first_kwarg": torch.tensor([2, 2])}
-        ret = rpc_async_call_remote_torchscript_in_torchscript(
-            dst_worker_name, args, kwargs
-        )
-        self.assertEqual(ret, torch.tensor([9, 9]))
 
+@torch.jit.script
+def rpc_async_call_remote_torchscript_in_torchscript_with_unexpected_kwarg(
+    dst_worker_name: str,  # noqa: E999
+):
+    args = (torch.tensor([1, 1]), torch.tensor([2, 2]))
+    kwargs = {"third_kwarg": torch.tensor([1, 1])}
+    fut = rpc.rpc_async(dst_worker_name, two_args_two_kwargs, args, kwargs)
+    ret = fut.wait()
+    return ret
+
+
+# Notice, TorchScript always translates(emits) Python `raise` statement,
+# as the exception message string, "Exception",
+# no matter what exception type and excetpion message are in the statement,
+@torch.jit.script
+def rpc_async_call_remote_raising_torchscript_in_torchscript(
+    dst_worker_name: str
+):
+    args = ()
+    kwargs = {}
+    fut = rpc.rpc_async(dst_worker_name, raise_script, args, kwargs)
+    ret = fut.wait()
+    return ret
+
+
+class JitRpcAsyncOpTest:
+    # Call functions remotely from Script.
     @dist_init
-    def test_no_kwargs_are_populated_by_defaults(self):
+    def test_kwargs_are_populated_by_defaults(self):
         if self.rank != 0:
             return
 
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
-
-        args = (torch.tensor([1, 1]), torch.tensor([2, 2]))
-        kwargs = {
-            "first_kwarg": torch.tensor([2, 2]),
-            "second_kwarg": torch.tensor([3, 3]),
-        }
-        ret = rpc_async_call_remote_torchscript_in_torchscript(
-            dst_worker_name, args, kwargs
+        dst_worker_name = self._next_worker
+
+        args = (_T11, _T22)
+        kwargs_list = [
+            # All kwargs are populated by defaults.
+            {},
+            # Some kwargs are populated by defaults.
+            {"first_kwarg": _T22},
+            # No kwargs are populated by defaults.
+            {"first_kwarg": _T22, "second_kwarg": _T33},
+        ]
+        rets = rpc_async_call_remote_torchscript_in_torchscript(
+            dst_worker_name, args, kwargs_list
+        )
+        self.assertEqual(
+            torch.stack(rets), torch.tensor([[10, 10], [9, 9], [8, 8]])
         )
-        self.assertEqual(ret, torch.tensor([8, 8]))
 
     @dist_init
     def test_kwargs_in_the_front_can_be_specified_by_extra_args(self):
         if self.rank != 0:
             return
 
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
-
-        @torch.jit.script
-        def rpc_async_call_remote_torchscript_in_torchscript_with_extra_arg(
-            dst_worker_name: str,  # noqa: E999
-        ):
-            args = (
-                torch.tensor([1, 1]),
-                torch.tensor([2, 2]),
-                # This extra arg will be fed to the first kwarg.
-                torch.tensor([2, 2]),
-            )
-            kwargs = {"second_kwarg": torch.tensor([3, 3])}
-            fut = rpc.rpc_async(dst_worker_name, two_args_two_kwargs, args, kwargs)
-            ret = fut.wait()
-            return ret
+        dst_worker_name = self._next_worker
 
         ret = rpc_async_call_remote_torchscript_in_torchscript_with_extra_arg(
             dst_worker_name
@@ -407,28 +495,7 @@ class JitRpcAsyncOpTest:
         if self.rank != 0:
             return
 
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
-
-        @torch.jit.script
-        def rpc_async_call_remote_torchscript_in_torchscript_with_assorted_types(
-            dst_worker_name: str
-        ):
-            args = (torch.tensor([1, 1]), "str_arg", 1)
-            # Must annotate the value type as `Any`, because JIT type inference
-            # does not support multiple types when defining a Dict.
-            # The error JIT gives is,
-            # "Dict values must contain only a single type, "
-            # "expected: Tensor but found str instead."
-            kwargs: Dict[str, Any] = {
-                "tensor_kwarg": torch.tensor([3, 3]),
-                "str_kwarg": "_str_kwarg",
-                "int_kwarg": 3,
-            }
-            fut = rpc.rpc_async(
-                dst_worker_name, assorted_types_args_kwargs, args, kwargs
-            )
-            ret = fut.wait()
-            return ret
+        dst_worker_name = self._next_worker
 
         ret = rpc_async_call_remote_torchscript_in_torchscript_with_assorted_types(
             dst_worker_name
@@ -440,16 +507,7 @@ class JitRpcAsyncOpTest:
         if self.rank != 0:
             return
 
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
-
-        @torch.jit.script
-        def rpc_async_call_remote_torchscript_in_torchscript_without_kwargs_passed(
-            dst_worker_name: str
-        ):
-            args = ()
-            fut = rpc.rpc_async(dst_worker_name, no_arg, args)
-            ret = fut.wait()
-            return ret
+        dst_worker_name = self._next_worker
 
         ret = rpc_async_call_remote_torchscript_in_torchscript_without_kwargs_passed(
             dst_worker_name
@@ -461,15 +519,7 @@ class JitRpcAsyncOpTest:
         if self.rank != 0:
             return
 
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
-
-        @torch.jit.script
-        def rpc_async_call_remote_torchscript_in_torchscript_without_args_kwargs_passed(
-            dst_worker_name: str
-        ):
-            fut = rpc.rpc_async(dst_worker_name, no_arg)
-            ret = fut.wait()
-            return ret
+        dst_worker_name = self._next_worker
 
         ret = rpc_async_call_remote_torchscript_in_torchscript_without_args_kwargs_passed(
             dst_worker_name
@@ -481,7 +531,7 @@ class JitRpcAsyncOpTest:
         if self.rank != 0:
             return
 
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
+        dst_worker_name = self._next_worker
 
         # Notice, args matching happens during scripting.
         with self.assertRaisesRegex(RuntimeError, "Argument second_arg not provided"):
@@ -501,7 +551,7 @@ class JitRpcAsyncOpTest:
         if self.rank != 0:
             return
 
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
+        dst_worker_name = self._next_worker
 
         # Notice, args matching happens during scripting.
         with self.assertRaisesRegex(
@@ -530,19 +580,9 @@ class JitRpcAsyncOpTest:
         if self.rank != 0:
             return
 
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
+        dst_worker_name = self._next_worker
 
         # Notice, kwargs matching happens during execution.
-        @torch.jit.script
-        def rpc_async_call_remote_torchscript_in_torchscript_with_unexpected_kwarg(
-            dst_worker_name: str,  # noqa: E999
-        ):
-            args = (torch.tensor([1, 1]), torch.tensor([2, 2]))
-            kwargs = {"third_kwarg": torch.tensor([1, 1])}
-            fut = rpc.rpc_async(dst_worker_name, two_args_two_kwargs, args, kwargs)
-            ret = fut.wait()
-            return ret
-
         with self.assertRaisesRegex(
             RuntimeError, "Unknown keyword argument 'third_kwarg'"
         ):
@@ -556,8 +596,11 @@ class JitRpcAsyncOpTest:
         if self.rank != 0:
             return
 
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
+        dst_worker_name = self._next_worker
 
+        # This must stay local to the test. Scripting it also compiles
+        # python_function, so only the caller has it and the callee has never
+        # seen it.
         @torch.jit.script
         def rpc_async_call_remote_py_function_in_torchscript(dst_worker_name: str):
             args = ()
@@ -577,20 +620,7 @@ class JitRpcAsyncOpTest:
         if self.rank != 0:
             return
 
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
-
-        # Notice, TorchScript always translates(emits) Python `raise` statement,
-        # as the exception message string, "Exception",
-        # no matter what exception type and excetpion message are in the statement,
-        @torch.jit.script
-        def rpc_async_call_remote_raising_torchscript_in_torchscript(
-            dst_worker_name: str
-        ):
-            args = ()
-            kwargs = {}
-            fut = rpc.rpc_async(dst_worker_name, raise_script, args, kwargs)
-            ret = fut.wait()
-            return ret
+        dst_worker_name = self._next_worker
 
         with self.assertRaisesRegex(RuntimeError, "Exception"):
             ret = rpc_async_call_remote_raising_torchscript_in_torchscript(
@@ -603,8 +633,10 @@ class JitRpcAsyncOpTest:
         if self.rank != 0:
             return
 
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
+        dst_worker_name = self._next_worker
 
+        # These must stay local to the test, so that only the caller compiles
+        # nonexisting_script and the callee has never seen it.
         @torch.jit.script
         def nonexisting_script():
             return 0
@@ -628,12 +660,6 @@ class JitRpcAsyncOpTest:
             self.assertEqual(ret, 0)
 
 
-@torch.jit.script
-def rref_to_here(rref_var):
-    # type: (RRef[Tensor]) -> Tensor
-    return rref_var.to_here()
-
-
 @torch.jit.script
 def return_rref(rref_var):
     # type: (RRef[Tensor]) -> RRef[Tensor]
@@ -677,30 +703,52 @@ def script_check_rref_confirmed(rref):
     return rref.confirmed_by_owner()
 
 
+@torch.jit.script
+def script_check_rref_confirmed_many(rrefs):
+    # type: (List[RRef[Tensor]]) -> List[bool]
+    return [rref.confirmed_by_owner() for rref in rrefs]
+
+
 @torch.jit.script
 def save_rref(rref_var, fname):
     # type: (RRef[Tensor], str) -> None
     torch.save(rref_var, fname)
 
 
+@torch.jit.script
+def future_wait_in_script(fut):
+    # type: (Future[Tensor]) -> Tensor
+    return fut.wait()
+
+
+@torch.jit.script
+def future_return_to_python(dst_worker_name, inputs):
+    # type: (str, Tuple[Tensor, Tensor]) -> Future[Tensor]
+    return rpc.rpc_async(
+        dst_worker_name,
+        two_args_two_kwargs,
+        inputs
+    )
+
+
 class JitRpcTest(RRefAPITest, LocalRRefTest, JitRpcAsyncOpTest, RpcAgentTestFixture):
     @dist_init
     def test_torchscript_function(self):
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
-        local_ret = one_arg(torch.ones(2, 2))
-        ret = rpc.rpc_sync(dst_worker_name, one_arg, args=(torch.ones(2, 2),))
+        dst_worker_name = self._next_worker
+        local_ret = one_arg(_ONES22)
+        ret = rpc.rpc_sync(dst_worker_name, one_arg, args=(_ONES22,))
         self.assertEqual(ret, local_ret)
-        rref = rpc.remote(dst_worker_name, one_arg, args=(torch.ones(2, 2),))
+        rref = rpc.remote(dst_worker_name, one_arg, args=(_ONES22,))
         self.assertEqual(rref.to_here(), local_ret)
         # create rref to itself
         local_rref = rpc.remote(
-            worker_name(self.rank), one_arg, args=(torch.ones(2, 2),)
+            worker_name(self.rank), one_arg, args=(_ONES22,)
         )
         self.assertEqual(local_rref.to_here(), local_ret)
 
     @dist_init
     def test_torchscript_function_exception(self):
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
+        dst_worker_name = self._next_worker
         with self.assertRaisesRegex(RuntimeError, r"one_arg\(\) expected at most"):
             ret = rpc.rpc_sync(dst_worker_name, one_arg, args=(10, 20))
 
@@ -709,7 +757,7 @@ class JitRpcTest(RRefAPITest, LocalRRefTest, JitRpcAsyncOpTest, RpcAgentTestFixt
 
     @dist_init
     def test_torchscript_functions_not_supported(self):
-        dst_worker_name = worker_name((self.rank + 1) % self.world_size)
+        dst_worker_name = self._next_worker
 
         my_local_script_module = MyScriptModule(self.rank)
 
@@ -737,27 +785,25 @@ class JitRpcTest(RRefAPITest, LocalRRefTest, JitRpcAsyncOpTest, RpcAgentTestFixt
 
     @dist_init
     def test_rref_as_arg_and_return(self):
-        n = self.rank + 1
-        dst_rank = n % self.world_size
-        local_ret = one_arg(torch.ones(2, 2))
+        local_ret = one_arg(_ONES22)
 
         # create rref on current rank
-        rref = rpc.remote(worker_name(self.rank), one_arg, args=(torch.ones(2, 2),))
+        rref = rpc.remote(worker_name(self.rank), one_arg, args=(_ONES22,))
 
+        # The four calls below are independent, so issue them all before
+        # waiting on any of them.
         # pass rref to another user in rpc call
-        ret = rpc.rpc_sync(worker_name(dst_rank), rref_to_here, args=(rref,))
-        self.assertEqual(ret, local_ret)
-
+        fut = rpc.rpc_async(self._next_worker, rref_to_here, args=(rref,))
         # return rref in rpc call
-        rref1 = rpc.rpc_sync(worker_name(dst_rank), return_rref, args=(rref,))
-        self.assertEqual(rref1.to_here(), local_ret)
-
+        fut1 = rpc.rpc_async(self._next_worker, return_rref, args=(rref,))
         # pass rref to another user in remote call
-        rref2 = rpc.remote(worker_name(dst_rank), rref_to_here, args=(rref,))
-        self.assertEqual(rref2.to_here(), local_ret)
-
+        rref2 = rpc.remote(self._next_worker, rref_to_here, args=(rref,))
         # return rref in remote call
-        rref3 = rpc.remote(worker_name(dst_rank), return_rref, args=(rref,))
+        rref3 = rpc.remote(self._next_worker, return_rref, args=(rref,))
+
+        self.assertEqual(fut.wait(), local_ret)
+        self.assertEqual(fut1.wait().to_here(), local_ret)
+        self.assertEqual(rref2.to_here(), local_ret)
         self.assertEqual(rref3.to_here().to_here(), local_ret)
 
     @dist_init
@@ -772,15 +818,13 @@ class JitRpcTest(RRefAPITest, LocalRRefTest, JitRpcAsyncOpTest, RpcAgentTestFixt
 
         local_ret = torch.ones(self.rank) + torch.ones(self.rank)
 
-        n = self.rank + 1
-        dst_rank = n % self.world_size
         remote_ref = rpc.remote(
-            worker_name(dst_rank), construct_my_script_module, args=(self.rank,)
+            self._next_worker, construct_my_script_module, args=(self.rank,)
         )
 
         # pass rref arg to owner
         ret = rpc.rpc_sync(
-            worker_name(dst_rank),
+            self._next_worker,
             run_ref_script_module,
             args=(remote_ref, torch.ones(self.rank)),
         )
@@ -798,51 +842,51 @@ class JitRpcTest(RRefAPITest, LocalRRefTest, JitRpcAsyncOpTest, RpcAgentTestFixt
 
     @dist_init
     def test_my_script_module_with_rrefs(self):
-        n = self.rank + 1
-        dst_rank = n % self.world_size
-
-        module_with_rrefs = MyScriptModuleWithRRefs(worker_name(dst_rank))
+        module_with_rrefs = MyScriptModuleWithRRefs(self._next_worker)
         res = module_with_rrefs()
         self.assertEqual(res, torch.ones(2, 2) * 9)
 
     @dist_init
     def test_rref_python_annotation(self):
-        n = self.rank + 1
-        dst_rank = n % self.world_size
-        rref_var = rpc_return_rref(worker_name(dst_rank))
+        rref_var = rpc_return_rref(self._next_worker)
 
         res = rref_script_annotation(rref_var)
-        self.assertEqual(res, torch.ones(2, 2) + 1)
+        self.assertEqual(res, _ONES22_PLUS_1)
 
     def _create_rref(self):
         owner_rank = (self.rank + 2) % self.world_size
         return rpc.remote(
-            worker_name(owner_rank), torch.add, args=(torch.zeros(2, 2), 1)
+            worker_name(owner_rank), torch.add, args=(_ZEROS22, 1)
         )
 
     @dist_init
     def test_user_rrefs_confirmed(self):
-        dst_rank = (self.rank + 1) % self.world_size
         rref = self._create_rref()
         ret = rpc.rpc_sync(
-            worker_name(dst_rank), script_check_rref_confirmed, args=(rref,)
+            self._next_worker, script_check_rref_confirmed, args=(rref,)
         )
         self.assertEqual(ret, True)
 
     @dist_init
     def test_user_rrefs_confirmed_remote(self):
-        dst_rank = (self.rank + 1) % self.world_size
         rref = self._create_rref()
         ret_rref = rpc.remote(
-            worker_name(dst_rank), script_check_rref_confirmed, args=(rref,)
+            self._next_worker, script_check_rref_confirmed, args=(rref,)
         )
         self.assertEqual(ret_rref.to_here(), True)
 
+    @dist_init
+    def test_user_rrefs_confirmed_many(self):
+        # Check several user RRefs in a single round trip.
+        rrefs = [self._create_rref() for _ in range(3)]
+        ret = rpc.rpc_sync(
+            self._next_worker, script_check_rref_confirmed_many, args=(rrefs,)
+        )
+        self.assertEqual(ret, [True] * 3)
+
     @dist_init
     def test_rref_jit_pickle_not_supported(self):
-        n = self.rank + 1
-        dst_rank = n % self.world_size
-        rref_var = rpc_return_rref(worker_name(dst_rank))
+        rref_var = rpc_return_rref(self._next_worker)
         with TemporaryFileName() as fname:
             with self.assertRaisesRegex(
                 RuntimeError, "RRef jit pickling is only allowed inside RPC calls"
@@ -851,37 +895,22 @@ class JitRpcTest(RRefAPITest, LocalRRefTest, JitRpcAsyncOpTest, RpcAgentTestFixt
 
     @dist_init
     def test_python_future_with_jit(self):
-        dst_rank = (self.rank + 1) % self.world_size
-        inputs = (torch.tensor([1, 1]), torch.tensor([2, 2]))
+        inputs = (_T11, _T22)
         ret_fut = rpc.rpc_async(
-            worker_name(dst_rank),
+            self._next_worker,
             two_args_two_kwargs,
             args=inputs
         )
         expected_res = torch.tensor([10, 10])
 
-        @torch.jit.script
-        def future_wait_in_script(fut):
-            # type: (Future[Tensor]) -> Tensor
-            return fut.wait()
-
         self.assertEqual(future_wait_in_script(ret_fut), expected_res)
 
-        @torch.jit.script
-        def future_return_to_python(dst_rank, inputs):
-            # type: (int, Tuple[Tensor, Tensor]) -> Future[Tensor]
-            return rpc.rpc_async(
-                "worker{}".format(dst_rank),
-                two_args_two_kwargs,
-                inputs
-            )
-
-        fut_res = future_return_to_python(dst_rank, inputs)
+        fut_res = future_return_to_python(self._next_worker, inputs)
         self.assertEqual(fut_res.wait(), expected_res)
 
     @dist_init
     def test_remote_script_throw(self):
-        rref = rpc.remote(worker_name((self.rank + 1) % self.world_size),
+        rref = rpc.remote(self._next_worker,
                           script_raise_func,
                           args=(torch.ones(2),))
         with self.assertRaisesRegex(Exception, ".*Expected error.*"):
@@ -889,7 +918,7 @@ class JitRpcTest(RRefAPITest, LocalRRefTest, JitRpcAsyncOpTest, RpcAgentTestFixt
 
     @dist_init
     def test_remote_script_udf(self):
-        rref = rpc.remote(worker_name((self.rank + 1) % self.world_size),
+        rref = rpc.remote(self._next_worker,
                           script_fork_wait_udf,
                           args=(torch.ones(2),))
         self.assertEqual(rref.to_here(), torch.ones(2) * 2)
@@ -897,7 +926,7 @@ class JitRpcTest(RRefAPITest, LocalRRefTest, JitRpcAsyncOpTest, RpcAgentTestFixt
     @dist_init
     def test_async_script_udf(self):
         future = rpc.rpc_async(
-            worker_name((self.rank + 1) % self.world_size),
+            self._next_worker,
             script_fork_wait_udf,
             args=(torch.ones(2),))
         self.assertEqual(future.wait(), torch.ones(2) * 2)
@@ -905,58 +934,62 @@ class JitRpcTest(RRefAPITest, LocalRRefTest, JitRpcAsyncOpTest, RpcAgentTestFixt
     @dist_init
     def test_async_script_throw(self):
         future = rpc.rpc_async(
-            worker_name((self.rank + 1) % self.world_size),
+            self._next_worker,
             script_fork_wait_throw,
             args=(torch.ones(2),))
         with self.assertRaisesRegex(Exception, ".*Expected error.*"):
             future.wait()
 
     @dist_init
-    def test_call_rpc_with_profiling(self):
-        # Ensures that we can call torch.ops.profiler._call_end_callbacks_on_jit_fut on a jit
-        # future from within a script function that calls rpc_async
-        if self.rank == 0:
-            with torch.autograd.profiler.profile() as prof:
-                prof_key = _build_rpc_profiling_key(
-                    RPCExecMode.ASYNC,
-                    torch.jit._qualified_name(one_arg),
-                    "worker0",
-                    "worker1",
-                )
-                with torch.autograd.profiler.record_function(prof_key) as rf:
-                    ret = call_rpc_with_profiling(rf.handle, "worker1")
-            # TODO: Can't get a reliable time for this profiling event since
-            # it's hard to estimate the execution time on the remote end for non-UDFs.
-            # This can be resolved by https://github.com/pytorch/pytorch/issues/36272.
-            # After that, this test should be modified to validate the function time.
-            events = prof.function_events
-            function_event = get_function_event(events, prof_key)
-            self.assertTrue(torch.jit._qualified_name(one_arg) in function_event.name)
-
-    def test_record_function_jit_end_callbacks_with_fork(self):
-        # Ensures that we can call rf._call_end_callbacks_on_future on a jit
-        # future in python eager mode with torch.jit.fork
-        sleep_interval = 1
-        with torch.autograd.profiler.profile() as prof:
-            with torch.autograd.profiler.record_function("foo") as rf:
+    def test_record_function_end_callbacks_on_jit_futures(self):
+        # Ensures that record_function end callbacks can be attached to jit
+        # futures from rpc_async within a script function, from torch.jit.fork
+        # in python eager mode, and from torch.jit.fork within a script
+        # function. All three are recorded in a single profiling session.
+        if self.rank != 0:
+            return
+
+        # The sleep check below is about when the end callbacks fire, not about
+        # how long the forked work takes, so a short sleep is enough.
+        sleep_interval = 0.05
+        # Build the key up front so that only the RPC itself is profiled.
+        qualified_name = torch.jit._qualified_name(one_arg)
+        prof_key = _build_rpc_profiling_key(
+            RPCExecMode.ASYNC,
+            qualified_name,
+            "worker0",
+            "worker1",
+        )
+        # Only event names and CPU times are checked below, so pin the cheapest
+        # profiler configuration rather than relying on its defaults.
+        with torch.autograd.profiler.profile(
+            use_cuda=False, record_shapes=False
+        ) as prof:
+            with torch.autograd.profiler.record_function(prof_key) as rf:
+                ret = call_rpc_with_profiling(rf.handle, "worker1")
+
+            with torch.autograd.profiler.record_function("foo_eager_fork") as rf:
                 fut = torch.jit._fork(sleep, sleep_interval)
                 rf._call_end_callbacks_on_future(fut)
             fut.wait()
 
-        function_events = prof.function_events
-        sleep_event = get_function_event(function_events, "foo")
-        self.assertEqual(sleep_event.name, "foo")
+            with torch.autograd.profiler.record_function("foo_script_fork") as rf:
+                ret = call_fork_with_profiling(rf.handle)
+
+        events_by_name = {event.name: event for event in prof.function_events}
+
+        # TODO: Can't get a reliable time for this profiling event since
+        # it's hard to estimate the execution time on the remote end for non-UDFs.
+        # This can be resolved by https://github.com/pytorch/pytorch/issues/36272.
+        # After that, this test should be modified to validate the function time.
+        self.assertIn(prof_key, events_by_name)
+        rpc_event = events_by_name[prof_key]
+        self.assertIn(qualified_name, rpc_event.name)
+
+        self.assertIn("foo_eager_fork", events_by_name)
+        sleep_event = events_by_name["foo_eager_fork"]
         # Validate that callbacks were fired at the right time by checking the
         # profiling event cpu time
         self.assertGreaterEqual(sleep_event.cpu_time * 1e-6, sleep_interval)
 
-    def test_call_fork_in_jit_with_profiling(self):
-        # Ensures that we can call torch.ops.profiler._call_end_callbacks_on_jit_fut on a jit
-        # future from within a script function with torch.jit.fork
-        with torch.autograd.profiler.profile() as prof:
-            with torch.autograd.profiler.record_function("foo") as rf:
-                ret = call_fork_with_profiling(rf.handle)
-
-        events = prof.function_events
-        function_event = get_function_event(events, "foo")
-        self.assertEqual(function_event.name, "foo")
+        self.assertIn("foo_script_fork", events_by_name)
@@ -7,6 +7,17 @@ class RpcAgentTestFixture(object):
     def world_size(self):
         return 4
 
+    @property
+    def _next_worker(self):
+        # The worker that ring-style tests on this rank send their RPCs to.
+        # The rank is only known once the test process runs, so compute the
+        # name on first use and reuse it afterwards.
+        if not hasattr(self, "_next_worker_name"):
+            self._next_worker_name = torch.testing._internal.dist_utils.worker_name(
+                (self.rank + 1) % self.world_size
+            )
+        return self._next_worker_name
+
     @property
     def init_method(self):
         return torch.testing._internal.dist_utils.INIT_METHOD_TEMPLATE.format(